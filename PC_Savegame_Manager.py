@@ -1,15 +1,27 @@
 import os
 import re
-import io
 import sys
 import json
+import functools
+import contextlib
+import zlib
+import gzip
+import hashlib
 import zipfile
+import mmap
+import struct
 import threading
+import time
 import datetime
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import urllib.error
 import urllib.parse
 import urllib.request
-from html.parser import HTMLParser
+from html import unescape as html_unescape
 import shutil
+import subprocess
 import webbrowser
 import traceback
 import tkinter as tk
@@ -25,8 +37,37 @@ DATE_APP = "2025/12/12"
 
 # Directories / cache
 CACHE_FILE = os.path.join(os.path.expanduser("~"), ".pc_savegame_manager_cache.json")
+# Bump when the shape of per-game entries (or hint extraction) changes
+CACHE_SCHEMA_VERSION = 2
+# Wiki lookups are reused without any request for this long...
+CACHE_TTL = 7 * 24 * 60 * 60
+# ...and "not on PCGamingWiki" results for this long before retrying
+NEGATIVE_CACHE_TTL = 24 * 60 * 60
 DEFAULT_BACKUP_DIR = os.path.join(os.path.expanduser("~"), "GameSaveBackups")
 
+# Backup ZIP compression presets (DEFLATE level). Save folders are mostly
+# small binaries and pre-compressed assets: level 1 is within a few % of 6
+# in size at roughly half the CPU time. "Store" (0) skips DEFLATE entirely
+# and writes every file as-is: fastest, for saves that don't compress.
+COMPRESSION_LEVELS = {"Store": 0, "Fast": 1, "Balanced": 6, "Max": 9}
+DEFAULT_COMPRESSION = "Fast"
+BACKUP_WORKERS = os.cpu_count() or 4
+# Files above this are streamed in chunks instead of buffered on a worker
+PARALLEL_MAX_FILE_SIZE = 32 * 1024 * 1024
+# Already-compressed formats: deflating them burns CPU for ~0% gain, so store as-is
+STORED_EXTENSIONS = frozenset({
+    ".zip", ".gz", ".7z", ".rar", ".xz", ".bz2", ".zst", ".lz4",
+    ".png", ".jpg", ".jpeg", ".webp",
+    ".mp4", ".webm", ".ogg", ".bik", ".bk2",
+    ".pak",
+})
+# Restores are mostly waiting on file creation/writes, so oversubscribe the CPUs
+RESTORE_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+# Members up to this are inflated in one call; larger ones stream (bounds RAM per worker)
+RESTORE_INFLATE_MAX = 4 * 1024 * 1024
+# Copy buffer for ZIP member reads/writes (shutil only uses 1 MiB on Windows)
+COPY_BUFSIZE = 1024 * 1024
+
 # GitHub + Donate
 GITHUB_REPO_URL = "https://github.com/ilukezippo/PC_Savegame_Manager"
 GITHUB_RELEASES_PAGE = GITHUB_REPO_URL + "/releases"
@@ -34,6 +75,8 @@ GITHUB_API_LATEST = "https://api.github.com/repos/ilukezippo/PC_Savegame_Manager
 DONATE_PAGE = "https://buymeacoffee.com/ilukezippo"
 
 PCGW_API = "https://www.pcgamingwiki.com/w/api.php"
+# Autocomplete results kept in memory (most recently used queries)
+SUGGEST_CACHE_SIZE = 256
 
 
 # -----------------------------
@@ -41,40 +84,91 @@ PCGW_API = "https://www.pcgamingwiki.com/w/api.php"
 # -----------------------------
 def load_cache():
     try:
-        with open(CACHE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except:
-        return {}
+        with open(CACHE_FILE, "rb") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict):
+        return {"schema_version": CACHE_SCHEMA_VERSION}
+    if data.get("schema_version") != CACHE_SCHEMA_VERSION:
+        # Per-game entries from an older schema: keep the cached section HTML
+        # (hints get re-extracted from it), drop anything else. Plain
+        # settings like last_backup_dir are not dicts and survive as-is.
+        for key, entry in list(data.items()):
+            if not isinstance(entry, dict):
+                continue
+            if entry.get("html"):
+                data[key] = {k: entry[k] for k in ("html", "title", "fetched_at") if k in entry}
+            else:
+                del data[key]
+        data["schema_version"] = CACHE_SCHEMA_VERSION
+    return data
+
+
+_cache_write_lock = threading.Lock()
 
 
 def save_cache(data):
+    # Write to a temp file and swap it in, so a crash mid-write can't
+    # leave a truncated cache behind
+    tmp = CACHE_FILE + ".tmp"
+    with _cache_write_lock:
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, CACHE_FILE)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+# Lines from worker threads are buffered per widget and flushed in one
+# Text.insert every LOG_FLUSH_MS, instead of one Tk event per line
+LOG_FLUSH_MS = 50
+_log_lock = threading.Lock()
+_log_pending = {}  # widget -> deque of lines waiting for the next flush
+
+
+def _log_write(widget, text):
     try:
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except:
+        widget.config(state="normal")
+        widget.insert("end", text)
+        widget.see("end")
+        widget.config(state="disabled")
+    except Exception:
+        # If widget was destroyed while a worker was still running
         pass
 
 
+def _log_flush(widget):
+    with _log_lock:
+        lines = _log_pending.pop(widget, None)
+    if lines:
+        _log_write(widget, "\n".join(lines) + "\n")
+
+
 def log_append(widget, text):
     """Thread-safe append to a Tk Text widget."""
-    def _do():
-        try:
-            widget.config(state="normal")
-            widget.insert("end", text + "\n")
-            widget.see("end")
-            widget.config(state="disabled")
-        except Exception:
-            # If widget was destroyed while a worker was still running
-            pass
+    with _log_lock:
+        pending = _log_pending.get(widget)
+        if pending is not None:
+            # Queue behind earlier lines so the log keeps its order
+            pending.append(text)
+            return
+        on_main = threading.current_thread() is threading.main_thread()
+        if not on_main:
+            _log_pending[widget] = deque([text])
 
+    if on_main:
+        _log_write(widget, text + "\n")
+        return
     try:
-        if threading.current_thread() is threading.main_thread():
-            _do()
-        else:
-            widget.after(0, _do)
+        widget.after(LOG_FLUSH_MS, _log_flush, widget)
     except Exception:
-        pass
-
+        with _log_lock:
+            _log_pending.pop(widget, None)
 
 
 # -----------------------------
@@ -100,20 +194,145 @@ def set_app_icon(root):
             pass
 
 
+# -----------------------------
+# Version helpers
+# -----------------------------
+@functools.lru_cache(maxsize=128)
+def parse_ver_tuple(v: str):
+    # First 4 digit runs, e.g. "v1.2.10-beta" -> (1, 2, 10)
+    nums = []
+    start = None
+    for i, ch in enumerate(v):
+        if "0" <= ch <= "9":
+            if start is None:
+                start = i
+        elif start is not None:
+            nums.append(int(v[start:i]))
+            start = None
+            if len(nums) == 4:
+                break
+    if start is not None and len(nums) < 4:
+        nums.append(int(v[start:]))
+    return tuple(nums) or (0,)
+
 
 # -----------------------------
-# HTML parser
+# HTML text extraction
 # -----------------------------
-class TextExtractor(HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self._buf = io.StringIO()
+# Tags and comments are dropped in one C-level pass instead of feeding the
+# page through html.parser callbacks; text runs are joined just like before.
+_TAG_RX = re.compile(r"<!--.*?-->|<[A-Za-z/!?][^>]*>", re.S)
 
-    def handle_data(self, data):
-        self._buf.write(data)
 
-    def get_text(self):
-        return self._buf.getvalue()
+def html_to_text(html):
+    return html_unescape(_TAG_RX.sub("", html))
+
+
+# -----------------------------
+# HTTP (pooled keep-alive connections)
+# -----------------------------
+HTTP_USER_AGENT = "PC-Savegame-Manager"
+HTTP_POOL_SIZE = 4  # idle connections kept per host
+
+# urlopen() honours system proxies; only bypass it when none are configured
+_HTTP_PROXIES = urllib.request.getproxies()
+_http_idle = {}
+_http_lock = threading.Lock()
+
+
+def _http_connection(scheme, host, timeout):
+    with _http_lock:
+        idle = _http_idle.get((scheme, host))
+        if idle:
+            conn = idle.pop()
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, timeout=timeout)
+    return http.client.HTTPConnection(host, timeout=timeout)
+
+
+def _http_release(scheme, host, conn):
+    with _http_lock:
+        idle = _http_idle.setdefault((scheme, host), [])
+        if len(idle) < HTTP_POOL_SIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _http_request(scheme, host, path, headers, timeout):
+    conn = _http_connection(scheme, host, timeout)
+    reused = conn.sock is not None
+    try:
+        conn.request("GET", path, headers=headers)
+        resp = conn.getresponse()
+        body = resp.read()
+    except (http.client.HTTPException, OSError):
+        conn.close()
+        if not reused:
+            raise
+        # The server dropped an idle keep-alive socket; retry on another one
+        return _http_request(scheme, host, path, headers, timeout)
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _http_release(scheme, host, conn)
+    return resp.status, resp.reason, resp.headers, body
+
+
+def _http_decode_body(headers, body):
+    # MediaWiki/GitHub JSON shrinks ~5-10x with gzip; worth it for page HTML
+    if body and headers.get("Content-Encoding", "").lower() == "gzip":
+        return gzip.decompress(body)
+    return body
+
+
+def http_get(url, headers=None, timeout=15):
+    """GET url reusing pooled connections; returns (status, headers, body).
+
+    Follows redirects and raises urllib.error.HTTPError for 4xx/5xx, like urlopen().
+    Bodies are requested gzip-compressed and returned decompressed.
+    """
+    hdrs = {"User-Agent": HTTP_USER_AGENT, "Accept-Encoding": "gzip"}
+    if headers:
+        hdrs.update(headers)
+
+    for _ in range(5):
+        u = urllib.parse.urlsplit(url)
+        if u.scheme in _HTTP_PROXIES:
+            req = urllib.request.Request(url, headers=hdrs)
+            try:
+                with urllib.request.urlopen(req, timeout=timeout) as r:
+                    return r.status, r.headers, _http_decode_body(r.headers, r.read())
+            except urllib.error.HTTPError as e:
+                if e.code >= 400:
+                    raise
+                return e.code, e.headers, b""
+
+        path = u.path or "/"
+        if u.query:
+            path += "?" + u.query
+        status, reason, resp_headers, body = _http_request(u.scheme, u.netloc, path, hdrs, timeout)
+
+        location = resp_headers.get("Location")
+        if status in (301, 302, 303, 307, 308) and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if status >= 400:
+            raise urllib.error.HTTPError(url, status, reason, resp_headers, None)
+        return status, resp_headers, _http_decode_body(resp_headers, body)
+
+    raise urllib.error.URLError("Too many redirects")
+
+
+def http_get_json(url, headers=None, timeout=15):
+    _, _, body = http_get(url, headers=headers, timeout=timeout)
+    # json.loads() detects UTF-8 on bytes itself; no separate decode copy
+    return json.loads(body)
 
 
 # -----------------------------
@@ -128,31 +347,69 @@ def pcgw_search_title(game_name):
         "format": "json",
     }
     url = PCGW_API + "?" + urllib.parse.urlencode(params)
-    with urllib.request.urlopen(url, timeout=15) as r:
-        data = json.loads(r.read().decode("utf-8", errors="replace"))
+    data = http_get_json(url, timeout=15)
     if len(data) >= 2 and data[1]:
         return data[1][0]
     return None
 
 
-def pcgw_find_save_section_index(title):
+def _find_save_section(sections):
+    for s in sections:
+        if s.get("line", "").strip().lower() == "save game data location":
+            return s
+    for s in sections:
+        if "save game data location" in s.get("line", "").strip().lower():
+            return s
+    return None
+
+
+def _slice_section_html(html, sections, sec):
+    """Cut sec (with its subsections) out of the full page HTML, or None."""
+    start = html.find(f'id="{sec.get("anchor", "")}"')
+    if not sec.get("anchor") or start < 0:
+        return None
+    start = max(0, html.rfind("<h", 0, start))
+
+    try:
+        level = int(sec.get("level", 0))
+        following = sections[sections.index(sec) + 1:]
+        nxt = next((n for n in following if int(n.get("level", 0)) <= level), None)
+    except (TypeError, ValueError):
+        return None
+    if nxt is None:
+        return html[start:]
+
+    end = html.find(f'id="{nxt.get("anchor", "")}"', start + 1)
+    if not nxt.get("anchor") or end < 0:
+        return None
+    return html[start:max(start, html.rfind("<h", start, end))]
+
+
+def pcgw_get_save_section(title):
+    """HTML of the page's save game data location section, or None.
+
+    Fetches sections and page text in one parse request and slices the
+    section locally, instead of a sections call followed by a text call.
+    """
     params = {
         "action": "parse",
         "page": title,
-        "prop": "sections",
+        "prop": "sections|text",
         "format": "json",
     }
     url = PCGW_API + "?" + urllib.parse.urlencode(params)
-    with urllib.request.urlopen(url, timeout=15) as r:
-        data = json.loads(r.read().decode("utf-8", errors="replace"))
-    sections = data.get("parse", {}).get("sections", [])
-    for s in sections:
-        if s.get("line", "").strip().lower() == "save game data location":
-            return s.get("index")
-    for s in sections:
-        if "save game data location" in s.get("line", "").strip().lower():
-            return s.get("index")
-    return None
+    data = http_get_json(url, timeout=15)
+    parse = data.get("parse", {})
+    sections = parse.get("sections", [])
+    sec = _find_save_section(sections)
+    if not sec or not sec.get("index"):
+        return None
+
+    html = _slice_section_html(parse.get("text", {}).get("*", ""), sections, sec)
+    if html is None:
+        # Unexpected heading markup: ask the API for just that section
+        html = pcgw_get_save_section_html(title, sec["index"])
+    return html
 
 
 def pcgw_get_save_section_html(title, idx):
@@ -164,164 +421,672 @@ def pcgw_get_save_section_html(title, idx):
         "format": "json",
     }
     url = PCGW_API + "?" + urllib.parse.urlencode(params)
-    with urllib.request.urlopen(url, timeout=15) as r:
-        data = json.loads(r.read().decode("utf-8", errors="replace"))
+    data = http_get_json(url, timeout=15)
     return data.get("parse", {}).get("text", {}).get("*", "")
 
 
+def pcgw_suggest_titles(q):
+    params = {
+        "action": "query",
+        "list": "search",
+        "srsearch": q,
+        "srlimit": 20,
+        "format": "json",
+    }
+    url = PCGW_API + "?" + urllib.parse.urlencode(params)
+    data = http_get_json(url, timeout=10)
+    return [i["title"] for i in data.get("query", {}).get("search", [])]
+
+
+# All path shapes share one tail, so a single alternation of prefixes
+# scans the text in one pass instead of trying 9 full patterns per position.
+_PATH_RX = re.compile(
+    r"(?:"
+    r"[A-Za-z]:\\"
+    r"|%[A-Za-z_]+%\\"
+    r"|~\\"
+    r"|\\Users\\[^\\\n\r]+\\"
+    r"|Documents\\"
+    r"|Saved Games\\"
+    r"|AppData\\(?:Roaming|Local)\\"
+    r"|OneDrive\\Documents\\"
+    r")"
+    r"[^\n\r<>\|\?\*\"]+"
+)
+# Trailing punctuation picked up from the surrounding prose
+_PATH_STRIP_CHARS = ". ;:\"')("
+
+
 def extract_windows_paths_from_html(html):
-    parser = TextExtractor()
-    parser.feed(html)
-    text = parser.get_text()
-
-    patterns = [
-        r"[A-Za-z]:\\[^\n\r<>\|\?\*\"]+",
-        r"%[A-Za-z_]+%\\[^\n\r<>\|\?\*\"]+",
-        r"~\\[^\n\r<>\|\?\*\"]+",
-        r"\\Users\\[^\\\n\r]+\\[^\n\r<>\|\?\*\"]+",
-        r"Documents\\[^\n\r<>\|\?\*\"]+",
-        r"Saved Games\\[^\n\r<>\|\?\*\"]+",
-        r"AppData\\Roaming\\[^\n\r<>\|\?\*\"]+",
-        r"AppData\\Local\\[^\n\r<>\|\?\*\"]+",
-        r"OneDrive\\Documents\\[^\n\r<>\|\?\*\"]+",
-    ]
-
-    rx = re.compile("(" + ")|(".join(patterns) + ")")
-    candidates = set(m.group(0) for m in rx.finditer(text))
-
-    cleaned = []
-    for c in candidates:
-        p = c.strip().rstrip(". ;:\"')(")
-        if len(p.split("\\")) < 2:
-            continue
-        cleaned.append(p)
+    text = html_to_text(html)
 
-    return sorted(set(cleaned))
+    # One set: dedupe happens on the cleaned form, which is what's returned
+    cleaned = {c.strip().rstrip(_PATH_STRIP_CHARS) for c in _PATH_RX.findall(text)}
+    return sorted(p for p in cleaned if "\\" in p)
 
 
 # -----------------------------
 # Path expansion
 # -----------------------------
+_ENV_VAR_RX = re.compile(r"%[A-Za-z_]+%")
+
+# Folder roots don't change while the app runs: resolve them once, not per hint
+_HOME = os.path.expanduser("~")
+_DOCS = os.path.join(_HOME, "Documents")
+_SAVED_GAMES = os.path.join(_HOME, "Saved Games")
+_ENV_VARS = {
+    "%USERPROFILE%": _HOME,
+    "%HOMEPATH%": os.environ.get("HOMEPATH", _HOME),
+    "%HOMEDRIVE%": os.environ.get("HOMEDRIVE", "C:"),
+    "%APPDATA%": os.environ.get("APPDATA", os.path.join(_HOME, "AppData", "Roaming")),
+    "%LOCALAPPDATA%": os.environ.get("LOCALAPPDATA", os.path.join(_HOME, "AppData", "Local")),
+    "%PROGRAMDATA%": os.environ.get("PROGRAMDATA", r"C:\ProgramData"),
+    "%PUBLIC%": os.environ.get("PUBLIC", r"C:\Users\Public"),
+}
+
+
+def _env_var_value(m):
+    return _ENV_VARS.get(m.group(0), m.group(0))
+
+
+# Pure function of the hint (the roots above are fixed), and the same wiki
+# hints come back on every lookup for a game
+@functools.lru_cache(maxsize=2048)
 def expand_path_hint(h):
-    home = os.path.expanduser("~")
-    docs = os.path.join(home, "Documents")
-    saved = os.path.join(home, "Saved Games")
-
-    env = {
-        "%USERPROFILE%": home,
-        "%HOMEPATH%": os.environ.get("HOMEPATH", home),
-        "%HOMEDRIVE%": os.environ.get("HOMEDRIVE", "C:"),
-        "%APPDATA%": os.environ.get("APPDATA", os.path.join(home, "AppData", "Roaming")),
-        "%LOCALAPPDATA%": os.environ.get("LOCALAPPDATA", os.path.join(home, "AppData", "Local")),
-        "%PROGRAMDATA%": os.environ.get("PROGRAMDATA", r"C:\ProgramData"),
-        "%PUBLIC%": os.environ.get("PUBLIC", r"C:\Users\Public"),
-    }
-
     p = h
 
     if p.startswith("~\\") or p.startswith("~/"):
-        p = os.path.join(home, p[2:])
+        p = os.path.join(_HOME, p[2:])
 
     l = p.lower()
     if l.startswith("documents\\"):
-        p = os.path.join(docs, p.split("\\", 1)[1])
+        p = os.path.join(_DOCS, p.split("\\", 1)[1])
     elif l.startswith("saved games\\"):
-        p = os.path.join(saved, p.split("\\", 1)[1])
+        p = os.path.join(_SAVED_GAMES, p.split("\\", 1)[1])
 
-    for k, v in env.items():
-        p = p.replace(k, v)
+    p = _ENV_VAR_RX.sub(_env_var_value, p)
 
     return os.path.normpath(p.replace("/", "\\"))
 
 
-def enumerate_existing_paths(hints):
+# Parents are probed concurrently: a miss on a OneDrive / network folder can
+# block for seconds, and stat/scandir release the GIL
+PROBE_WORKERS = 8
+
+
+def _probe_parent(parent, items, listings=None):
+    """Return the expanded hints in `items` that exist under `parent`.
+
+    `listings` (parent -> normcased names) lets several probes in one lookup
+    share a directory listing.
+    """
+    names = listings.get(parent) if listings is not None else None
+    if names is None:
+        try:
+            with os.scandir(parent) as it:
+                names = frozenset(os.path.normcase(e.name) for e in it)
+        except (FileNotFoundError, NotADirectoryError):
+            names = frozenset()
+        except OSError:
+            # Parent not listable (permissions): probe the hints directly
+            return [exp for exp, _ in items if os.path.exists(exp)]
+        if listings is not None:
+            listings[parent] = names
     found = []
-    for hint in hints:
-        exp = expand_path_hint(hint)
-        if os.path.exists(exp):
+    for exp, name in items:
+        if name and os.path.normcase(name) in names:
             found.append(exp)
-    return sorted(set(found))
+        elif not name and os.path.exists(exp):
+            found.append(exp)
+    return found
+
+
+def _prune_nested(paths):
+    """Drop duplicates and paths inside another path of the list.
+
+    A nested hint can only exist if its ancestor does, and make_backup walks
+    the ancestor anyway, so probing (and backing up) it again is redundant.
+    """
+    roots = []
+    prefixes = []
+    for p in sorted(set(paths), key=len):
+        key = os.path.normcase(p)
+        if any(key == r or key.startswith(r + os.sep) for r in prefixes):
+            continue
+        roots.append(p)
+        prefixes.append(key.rstrip(os.sep))
+    return roots
+
+
+def enumerate_existing_paths(hints, listings=None):
+    # Hints mostly share a few parents (%APPDATA%, Documents\My Games, ...):
+    # list each parent once and test names against it instead of one stat per hint.
+    by_parent = {}
+    for exp in _prune_nested(expand_path_hint(h) for h in hints):
+        parent, name = os.path.split(exp)
+        by_parent.setdefault(parent, []).append((exp, name))
+
+    if len(by_parent) <= 1:
+        results = [_probe_parent(*kv, listings) for kv in by_parent.items()]
+    else:
+        with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(by_parent))) as ex:
+            results = list(ex.map(lambda kv: _probe_parent(*kv, listings), by_parent.items()))
+
+    found = set()
+    for r in results:
+        found.update(r)
+    return sorted(found)
 
 
 # -----------------------------
 # Backup creation
 # -----------------------------
-def make_backup(game_name, paths, backup_root, log_widget):
+_SAFE_NAME_RX = re.compile(r"[^\w\s.-]")
+
+
+class _SafeNameTable(dict):
+    """Lazily filled str.translate table equivalent to _SAFE_NAME_RX.sub("_", ...)."""
+    def __missing__(self, cp):
+        ch = chr(cp)
+        rep = self[cp] = "_" if _SAFE_NAME_RX.match(ch) else ch
+        return rep
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+
+def _iter_files(base):
+    """Yield (path, relpath, size, mtime_ns) for every file under base using os.scandir.
+
+    DirEntry carries the file type (and on Windows the size) from the
+    directory listing, so no extra stat() is needed per file like os.walk.
+    Raises NotADirectoryError / FileNotFoundError if base itself is not a
+    folder, so callers don't need a separate isdir() probe.
+    """
+    stack = [(base, "")]
+    while stack:
+        d, prefix = stack.pop()
+        try:
+            it = os.scandir(d)
+        except (NotADirectoryError, FileNotFoundError):
+            if d is base:
+                raise
+            continue
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append((e.path, prefix + e.name + os.sep))
+                    elif e.is_file():
+                        st = e.stat()
+                        yield e.path, prefix + e.name, st.st_size, st.st_mtime_ns
+                except OSError:
+                    continue
+
+
+def _compress_type_for(path, level):
+    if level == 0:
+        return zipfile.ZIP_STORED
+    ext = os.path.splitext(path)[1].lower()
+    return zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+_dedupe_lock = threading.Lock()
+
+
+def _compress_file(fpath, arcname, level, seen=None):
+    """Read + raw-deflate one file on a worker; returns (zinfo, blob, owned dedupe key)."""
+    zinfo = zipfile.ZipInfo.from_file(fpath, arcname)
+    with open(fpath, "rb") as f:
+        data = f.read()
+    zinfo.compress_type = _compress_type_for(fpath, level)
+    zinfo.file_size = len(data)
+
+    slot = None
+    if seen is not None:
+        key = (zinfo.compress_type, hashlib.blake2b(data, digest_size=16).digest())
+        with _dedupe_lock:
+            hit = seen.get(key)
+            if hit is None:
+                slot = seen[key] = [threading.Event(), None]
+        if hit is not None:
+            hit[0].wait()
+            if hit[1] is not None:
+                blob, zinfo.CRC = hit[1]
+                zinfo.compress_size = len(blob)
+                return zinfo, blob, None
+
+    try:
+        if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+            co = zlib.compressobj(level, zlib.DEFLATED, -15)
+            blob = co.compress(data) + co.flush()
+        else:
+            blob = data
+        zinfo.compress_size = len(blob)
+        zinfo.CRC = zlib.crc32(data)
+        if slot is not None:
+            slot[1] = (blob, zinfo.CRC)
+    finally:
+        if slot is not None:
+            slot[0].set()
+            if slot[1] is None:
+                # Failed: let a later copy take over instead
+                _release_dedupe(seen, key)
+    return zinfo, blob, (key if slot is not None else None)
+
+
+def _release_dedupe(seen, key):
+    """Forget a dedupe entry; copies already waiting on it keep their reference."""
+    with _dedupe_lock:
+        seen.pop(key, None)
+
+
+def _stream_file(z, fpath, arcname, level):
+    """Copy a large file into the ZIP in COPY_BUFSIZE chunks (flat memory).
+
+    The file is memory-mapped and fed to the compressor as memoryview slices,
+    so pages go straight from the page cache to zlib without a bytes copy.
+    """
+    zinfo = zipfile.ZipInfo.from_file(fpath, arcname)
+    zinfo.compress_type = _compress_type_for(fpath, level)
+    zinfo._compresslevel = level
+    with open(fpath, "rb", buffering=0) as src, z.open(zinfo, "w", force_zip64=True) as dst:
+        try:
+            mm = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty or unmappable file
+            shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+            return
+        with mm, memoryview(mm) as mv:
+            for off in range(0, len(mv), COPY_BUFSIZE):
+                with mv[off:off + COPY_BUFSIZE] as chunk:
+                    dst.write(chunk)
+
+
+def _write_compressed(z, zinfo, blob):
+    """Append an already-compressed member, bypassing zipfile's own compressor."""
+    _append_member(z, zinfo, (blob,))
+
+
+def _append_member(z, zinfo, chunks):
+    """Write zinfo's local header + data chunks; a failed write leaves no partial bytes."""
+    with z._lock:
+        z.fp.seek(z.start_dir)
+        zinfo.header_offset = z.fp.tell()
+        z._writecheck(zinfo)
+        z._didModify = True
+        try:
+            z.fp.write(zinfo.FileHeader())
+            for chunk in chunks:
+                z.fp.write(chunk)
+        except BaseException:
+            # close() only truncates in mode "a": cut the partial member here
+            z.fp.seek(z.start_dir)
+            z.fp.truncate()
+            raise
+        z.start_dir = z.fp.tell()
+        z.filelist.append(zinfo)
+        z.NameToInfo[zinfo.filename] = zinfo
+
+
+def _previous_backup(out_dir, exclude):
+    """Newest existing backup ZIP in out_dir (names sort by timestamp), or None."""
+    try:
+        with os.scandir(out_dir) as it:
+            names = [e.name for e in it
+                     if e.name.lower().endswith(".zip") and e.path != exclude and e.is_file()]
+    except OSError:
+        return None
+    return os.path.join(out_dir, max(names)) if names else None
+
+
+def _reusable_members(prev_z, level):
+    """{source path: (ZipInfo, size, mtime_ns)} from a previous same-level backup's manifest."""
+    try:
+        meta = json.loads(prev_z.read("__pcsm_paths.json"))
+    except Exception:
+        return {}
+    if not isinstance(meta, dict) or meta.get("level") != level:
+        return {}
+    out = {}
+    files = meta.get("files")
+    for fpath, entry in (files.items() if isinstance(files, dict) else ()):
+        try:
+            arcname, size, mtime_ns = entry
+            out[fpath] = (prev_z.getinfo(arcname), size, mtime_ns)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return out
+
+
+def _copy_raw_member(z, src_z, src_info, arcname):
+    """Append src_info from src_z under arcname as-is: no inflate, no deflate."""
+    zinfo = zipfile.ZipInfo(arcname, src_info.date_time)
+    zinfo.compress_type = src_info.compress_type
+    zinfo.external_attr = src_info.external_attr
+    zinfo.file_size = src_info.file_size
+    zinfo.compress_size = src_info.compress_size
+    zinfo.CRC = src_info.CRC
+
+    fp = src_z.fp
+    fp.seek(_member_data_offset(fp, src_info))
+
+    def chunks():
+        remaining = src_info.compress_size
+        while remaining:
+            chunk = fp.read(min(remaining, COPY_BUFSIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {src_info.filename}")
+            remaining -= len(chunk)
+            yield chunk
+
+    _append_member(z, zinfo, chunks())
+
+
+def make_backup(game_name, paths, backup_root, log_widget, level=COMPRESSION_LEVELS[DEFAULT_COMPRESSION]):
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_name = re.sub(r"[^\w\s.-]", "_", game_name).strip() or "Game"
+    safe_name = game_name.translate(_SAFE_NAME_TABLE).strip() or "Game"
     out_dir = os.path.join(backup_root, safe_name)
     os.makedirs(out_dir, exist_ok=True)
     zip_path = os.path.join(out_dir, f"{safe_name}_{timestamp}.zip")
+    prev_path = _previous_backup(out_dir, zip_path)
 
     log_append(log_widget, f"→ Creating backup: {zip_path}")
 
     records = []
+    # Unreadable files are collected and reported once, not logged per file
+    skipped = []
+    # source path -> [arcname, size, mtime_ns]; lets the next backup reuse
+    # unchanged members from this one
+    manifest = {}
+    reused = 0
+
+    compression = zipfile.ZIP_STORED if level == 0 else zipfile.ZIP_DEFLATED
+    with contextlib.ExitStack() as stack:
+        z = stack.enter_context(zipfile.ZipFile(zip_path, "w", compression=compression,
+                                                compresslevel=level))
+        pool = None  # started below unless there's only one file
+        prev_z, reusable = None, {}
+        if prev_path:
+            try:
+                prev_z = stack.enter_context(open_backup_zip(prev_path))
+                reusable = _reusable_members(prev_z, level)
+            except (OSError, zipfile.BadZipFile):
+                pass
 
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as z:
-        for idx, base in enumerate(paths):
-            base = os.path.normpath(base)
+        # Workers compress in parallel; only this thread touches the ZIP
+        pending = deque()
 
-            if os.path.isdir(base):
-                records.append({"index": idx, "type": "dir", "base": base})
-                for root, dirs, files in os.walk(base):
-                    for f in files:
-                        fpath = os.path.join(root, f)
-                        rel = os.path.relpath(fpath, base)
-                        arcname = f"{idx}/{rel}"
-                        try:
-                            z.write(fpath, arcname)
-                        except Exception as e:
-                            log_append(log_widget, f"⚠ Skipped {fpath}: {e}")
-            else:
-                records.append({"index": idx, "type": "file", "base": base})
-                rel = os.path.basename(base)
-                arcname = f"{idx}/{rel}"
+        def drain(limit):
+            while len(pending) > limit:
+                fpath, entry, fut = pending.popleft()
+                try:
+                    zinfo, blob, key = fut.result()
+                except Exception as e:
+                    skipped.append((fpath, str(e)))
+                    continue
                 try:
-                    z.write(base, arcname)
+                    _write_compressed(z, zinfo, blob)
                 except Exception as e:
-                    log_append(log_widget, f"⚠ Skipped {base}: {e}")
+                    skipped.append((fpath, str(e)))
+                else:
+                    manifest[fpath] = entry
+                finally:
+                    if key is not None:
+                        _release_dedupe(dup_blobs, key)
+
+        def add(fpath, arcname, size, mtime_ns):
+            nonlocal reused
+            entry = [arcname, size, mtime_ns]
+            prev = reusable.get(fpath)
+            if prev is not None and size is not None and prev[1:] == (size, mtime_ns):
+                # Unchanged since the previous backup: copy its compressed bytes
+                try:
+                    _copy_raw_member(z, prev_z, prev[0], arcname)
+                except Exception:
+                    pass  # fall back to compressing it again
+                else:
+                    manifest[fpath] = entry
+                    reused += 1
+                    return
 
-        meta = {"game": game_name, "paths": records}
-        z.writestr("__pcsm_paths.json", json.dumps(meta, ensure_ascii=False, indent=2))
+            big = size is None or size > PARALLEL_MAX_FILE_SIZE
+            if big:
+                try:
+                    _stream_file(z, fpath, arcname, level)
+                except Exception as e:
+                    skipped.append((fpath, str(e)))
+                else:
+                    manifest[fpath] = entry
+                return
 
+            if pool is None:
+                # Single file (e.g. one SQLite save): no point in a pool
+                try:
+                    _write_compressed(z, *_compress_file(fpath, arcname, level)[:2])
+                except Exception as e:
+                    skipped.append((fpath, str(e)))
+                else:
+                    manifest[fpath] = entry
+                return
+
+            # Only files sharing a size with another one can be duplicates
+            seen = dup_blobs if size in dup_sizes else None
+            fut = pool.submit(_compress_file, fpath, arcname, level, seen)
+            pending.append((fpath, entry, fut))
+            # Bound the number of in-memory buffers
+            drain(BACKUP_WORKERS * 2)
+
+        # Collect the file list first so duplicate candidates are known up front
+        files = []
+        for idx, base in enumerate(paths):
+            base = os.path.normpath(base)
+
+            try:
+                files.extend((fpath, f"{idx}/{rel}", size, mtime_ns)
+                             for fpath, rel, size, mtime_ns in _iter_files(base))
+            except (NotADirectoryError, FileNotFoundError):
+                pass
+            else:
+                records.append({"index": idx, "type": "dir", "base": base})
+                continue
+
+            records.append({"index": idx, "type": "file", "base": base})
+            rel = os.path.basename(base)
+            try:
+                st = os.stat(base)
+                size, mtime_ns = st.st_size, st.st_mtime_ns
+            except OSError:
+                size = mtime_ns = None  # let _stream_file() report the error
+            files.append((base, f"{idx}/{rel}", size, mtime_ns))
+
+        size_counts = Counter(f[2] for f in files if f[2])
+        dup_sizes = {size for size, n in size_counts.items() if n > 1}
+        dup_blobs = {}
+        if len(files) > 1:
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=BACKUP_WORKERS))
+
+        for fpath, arcname, size, mtime_ns in files:
+            add(fpath, arcname, size, mtime_ns)
+
+        drain(0)
+
+        meta = {"game": game_name, "paths": records, "level": level, "files": manifest}
+        if skipped:
+            meta["skipped"] = [{"path": fpath, "error": err} for fpath, err in skipped]
+        z.writestr("__pcsm_paths.json",
+                   json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    if reused:
+        log_append(log_widget, f"Reused {reused} unchanged files from {os.path.basename(prev_path)}.")
+    if skipped:
+        log_append(log_widget, f"⚠ Skipped {len(skipped)} files (first: {skipped[0][0]}; full list in __pcsm_paths.json)")
     log_append(log_widget, "✓ Backup complete.")
     return zip_path
 
 
+# -----------------------------
+# Restore helpers
+# -----------------------------
+# "<path index>/<relative path>" members; excludes folder entries and the
+# top-level __pcsm_paths.json in the same match
+_ENTRY_RX = re.compile(r"([0-9]+)/(.*[^/])\Z", re.S)
+
+
+@contextlib.contextmanager
+def open_backup_zip(path):
+    """Open a backup ZIP for reading through a COPY_BUFSIZE-buffered handle.
+
+    The central directory and member headers are many small reads; a large
+    buffer serves them (and the following compressed data) from one syscall.
+    """
+    with open(path, "rb", buffering=COPY_BUFSIZE) as fh, zipfile.ZipFile(fh, "r") as z:
+        yield z
+
+
+def any_existing(paths):
+    """True if any of `paths` exists; one directory listing per parent folder."""
+    by_parent = {}
+    for p in paths:
+        parent, name = os.path.split(p)
+        by_parent.setdefault(parent, []).append(name)
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                existing = {os.path.normcase(e.name) for e in it}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except OSError:
+            if any(os.path.exists(os.path.join(parent, n)) for n in names):
+                return True
+            continue
+        if any(os.path.normcase(n) in existing for n in names):
+            return True
+    return False
+
+
+def _member_data_offset(fp, zinfo):
+    """File offset of a member's data, just past its local header."""
+    fp.seek(zinfo.header_offset)
+    header = fp.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local header for {zinfo.filename}")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    return zinfo.header_offset + zipfile.sizeFileHeader + name_len + extra_len
+
+
+def extract_member(z, zinfo, dest):
+    """Write one member to dest. `z` must not be shared with other threads.
+
+    Deflated members up to RESTORE_INFLATE_MAX are read raw and inflated
+    in one zlib call (CRC still checked); anything else streams through
+    zipfile with a COPY_BUFSIZE buffer.
+    """
+    plain = not zinfo.flag_bits & 0x1
+    if (plain and zinfo.compress_type == zipfile.ZIP_DEFLATED
+            and zinfo.file_size <= RESTORE_INFLATE_MAX):
+        z.fp.seek(_member_data_offset(z.fp, zinfo))
+        data = zlib.decompress(z.fp.read(zinfo.compress_size), -15, zinfo.file_size or 1)
+        if len(data) != zinfo.file_size or zlib.crc32(data) != zinfo.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {zinfo.filename!r}")
+        with open(dest, "wb") as dst:
+            dst.write(data)
+        return
+
+    with z.open(zinfo) as src, open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+
+
+# -----------------------------
+# Cloud sync helpers
+# -----------------------------
+def _copy_if_changed(src, dst):
+    """copy2() unless dst already has the same size and mtime (a previous sync).
+
+    copy2 preserves mtime, so re-running a sync only copies files that changed.
+    """
+    try:
+        s, d = os.stat(src), os.stat(dst)
+        if s.st_size == d.st_size and abs(s.st_mtime - d.st_mtime) < 2:
+            return dst
+    except OSError:
+        pass
+    return shutil.copy2(src, dst)
+
+
+def _create_junction(link_path, target_path):
+    """Create an NTFS junction at link_path pointing to target_path."""
+    try:
+        import _winapi
+        create = _winapi.CreateJunction
+    except (ImportError, AttributeError):
+        create = None
+    if create is not None:
+        # Direct reparse-point call: no cmd.exe, no shell quoting
+        create(target_path, link_path)
+        return
+    subprocess.run(["cmd", "/c", "mklink", "/J", link_path, target_path],
+                   check=True, capture_output=True,
+                   creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+
+
 # -----------------------------
 # Search for save paths
 # -----------------------------
-def find_save_paths(game_name, log_widget):
-    cache = load_cache()
+def find_save_paths(game_name, log_widget, cache):
+    """Look up save paths; results (including misses) go into the in-memory cache dict."""
     key = game_name.lower()
-
-    if key in cache and cache[key].get("hints"):
-        existing = enumerate_existing_paths(cache[key]["hints"])
-        if existing:
-            log_append(log_widget, f"Found cached paths for '{game_name}'.")
-            return existing, cache[key]["hints"]
+    entry = cache.get(key)
+    # Folder listings shared by the cached-hint probe and the fresh one below
+    listings = {}
+
+    if isinstance(entry, dict):
+        if entry.get("miss"):
+            if time.time() - entry.get("fetched_at", 0) < NEGATIVE_CACHE_TTL:
+                log_append(log_widget, f"No PCGamingWiki save data for '{game_name}' (cached).")
+                return [], []
+        else:
+            hints = entry.get("hints")
+            if hints is None and entry.get("html"):
+                # Replace, never mutate: a cache flush may be serializing `entry`
+                hints = extract_windows_paths_from_html(entry["html"])
+                cache[key] = {**entry, "hints": hints}
+            if hints:
+                existing = enumerate_existing_paths(hints, listings)
+                if existing:
+                    log_append(log_widget, f"Found cached paths for '{game_name}'.")
+                    return existing, hints
+                # Nothing on disk yet, but the wiki answer is recent: asking
+                # again would return the same hints
+                if time.time() - entry.get("fetched_at", 0) < CACHE_TTL:
+                    log_append(log_widget, f"Using cached PCGamingWiki paths for '{game_name}'.")
+                    return existing, hints
+
+    def miss():
+        cache[key] = {"miss": True, "fetched_at": time.time()}
+        return [], []
 
     log_append(log_widget, f"Searching PCGamingWiki for '{game_name}'…")
     title = pcgw_search_title(game_name)
     if not title:
-        return [], []
+        return miss()
 
     log_append(log_widget, f"→ Matched: {title}")
 
-    idx = pcgw_find_save_section_index(title)
-    if not idx:
-        return [], []
+    html = pcgw_get_save_section(title)
+    if html is None:
+        return miss()
 
-    html = pcgw_get_save_section_html(title, idx)
     hints = extract_windows_paths_from_html(html)
 
     if not hints:
-        return [], []
+        return miss()
 
-    existing = enumerate_existing_paths(hints)
+    existing = enumerate_existing_paths(hints, listings)
 
-    cache[key] = {"hints": hints}
-    save_cache(cache)
+    cache[key] = {"hints": hints, "title": title, "html": html, "fetched_at": time.time()}
 
     return existing, hints
 
@@ -429,9 +1194,17 @@ class App(tk.Tk):
         # =============================
         # Load cache
         # =============================
-        cache = load_cache()
-        last_dir = cache.get("last_backup_dir", DEFAULT_BACKUP_DIR)
+        # Kept in memory for the whole session; writes are coalesced and done
+        # off the UI thread (see mark_cache_dirty)
+        self._cache = load_cache()
+        self._cache_flush_id = None
+        self._cache_flush_thread = None
+        last_dir = self._cache.get("last_backup_dir", DEFAULT_BACKUP_DIR)
         self.backup_dir = tk.StringVar(value=last_dir)
+        compression = self._cache.get("compression", DEFAULT_COMPRESSION)
+        if compression not in COMPRESSION_LEVELS:
+            compression = DEFAULT_COMPRESSION
+        self.compression = tk.StringVar(value=compression)
 
         self.suggestion_box = None
         self.suggest_after_id = None
@@ -440,6 +1213,13 @@ class App(tk.Tk):
 
         self.suggest_seq = 0
         self.last_suggest_query = ""
+        # normalized query -> titles; only touched on the UI thread
+        self._suggest_cache = OrderedDict()
+        # At most one autocomplete fetch in flight; a query still waiting for
+        # it is replaced by the next keystroke's query
+        self._suggest_lock = threading.Lock()
+        self._suggest_next = None
+        self._suggest_running = False
         self.suppress_suggestions = False
 
         # Header
@@ -474,6 +1254,8 @@ class App(tk.Tk):
             self.game_entry.bind("<FocusIn>", self._entry_refocus_check_suggestions, add="+")
             self.game_entry.bind("<Button-1>", self._entry_refocus_check_suggestions, add="+")
 
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # Center + auto-check for updates
         self.after(100, self.center)
         self.after(1200, self.check_latest_app_version_async)
@@ -574,9 +1356,39 @@ class App(tk.Tk):
         y = (sh // 2) - (h // 2)
         self.geometry(f"{w}x{h}+{x}+{y}")
 
+    # -----------------------------
+    # Cache persistence
+    # -----------------------------
+    def mark_cache_dirty(self):
+        """Schedule a cache write 1 s after the last change (coalesces bursts)."""
+        if self._cache_flush_id:
+            self.after_cancel(self._cache_flush_id)
+        self._cache_flush_id = self.after(1000, self._flush_cache)
+
+    def _flush_cache(self):
+        self._cache_flush_id = None
+        # Entries are replaced, never mutated, so a shallow copy is a stable snapshot
+        snapshot = dict(self._cache)
+        self._cache_flush_thread = threading.Thread(target=save_cache, args=(snapshot,), daemon=True)
+        self._cache_flush_thread.start()
+
+    def on_close(self):
+        # Write any pending change synchronously before exiting
+        if self._cache_flush_id:
+            self.after_cancel(self._cache_flush_id)
+            self._cache_flush_id = None
+            save_cache(dict(self._cache))
+        elif self._cache_flush_thread is not None:
+            self._cache_flush_thread.join(timeout=2)
+        self.destroy()
+
     # -----------------------------
     # Async helpers + loading
     # -----------------------------
+    def open_url(self, url):
+        """Open url in the default browser without blocking the UI thread."""
+        threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
+
     def run_async(self, loading_text, work_fn, on_success=None, on_error=None, show_loading=True):
         """Run work_fn() in a daemon thread; marshal callbacks back to the UI thread."""
         if show_loading:
@@ -662,12 +1474,23 @@ class App(tk.Tk):
         ttk.Entry(row2, textvariable=self.backup_dir).pack(side="left", fill="x", expand=True, padx=8)
         ttk.Button(row2, text="Browse…", command=self.on_browse, style="Big.TButton").pack(side="left")
 
+        ttk.Label(row2, text="Compression:").pack(side="left", padx=(16, 0))
+        compression_box = ttk.Combobox(
+            row2,
+            textvariable=self.compression,
+            values=list(COMPRESSION_LEVELS),
+            state="readonly",
+            width=9
+        )
+        compression_box.pack(side="left", padx=(8, 0))
+        compression_box.bind("<<ComboboxSelected>>", self.on_compression_changed)
+
         # Split: detected paths + log
         paned = ttk.Panedwindow(frame, orient="vertical")
         paned.pack(fill="both", expand=True)
 
         paths_box = ttk.Labelframe(paned, text="Detected Save Paths")
-        self.paths_list = tk.Listbox(paths_box, height=8)
+        self.paths_list = tk.Listbox(paths_box, height=8, exportselection=False)
         self.paths_list.pack(fill="both", expand=True, padx=8, pady=8)
         self.paths_list.bind("<Double-Button-1>", self.open_selected_path)
         paned.add(paths_box, weight=1)
@@ -777,7 +1600,7 @@ class App(tk.Tk):
 
         # ---- clickable download link row (inside tips_body) ----
         def _open_gdrive_download():
-            webbrowser.open("https://www.google.com/drive/download/")
+            self.open_url("https://www.google.com/drive/download/")
 
         row_link = ttk.Frame(tips_body)
         row_link.pack(anchor="w", fill="x", pady=(0, 4))
@@ -843,9 +1666,9 @@ class App(tk.Tk):
                 os.rename(save_path, backup_path)
 
             # Create junction to Google Drive folder
-            cmd = f'mklink /J "{save_path}" "{drive_path}"'
-            result = os.system(cmd)
-            if result != 0:
+            try:
+                _create_junction(save_path, drive_path)
+            except (OSError, subprocess.CalledProcessError):
                 raise RuntimeError("Failed to create junction. Run the app as Administrator.")
 
             # Copy existing save data into Drive folder
@@ -853,9 +1676,9 @@ class App(tk.Tk):
                 src = os.path.join(backup_path, item)
                 dst = os.path.join(drive_path, item)
                 if os.path.isdir(src):
-                    shutil.copytree(src, dst, dirs_exist_ok=True)
+                    shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=_copy_if_changed)
                 else:
-                    shutil.copy2(src, dst)
+                    _copy_if_changed(src, dst)
 
             return True
 
@@ -901,7 +1724,7 @@ class App(tk.Tk):
             font=("Segoe UI", 9, "underline")
         )
         email_lbl.pack(side="left")
-        email_lbl.bind("<Button-1>", lambda e: webbrowser.open("mailto:ilukezippo@gmail.com"))
+        email_lbl.bind("<Button-1>", lambda e: self.open_url("mailto:ilukezippo@gmail.com"))
 
         # GitHub link
         link_row = ttk.Frame(frame)
@@ -915,7 +1738,7 @@ class App(tk.Tk):
             font=("Segoe UI", 9, "underline")
         )
         gh_lbl.pack(side="left")
-        gh_lbl.bind("<Button-1>", lambda e: webbrowser.open(GITHUB_REPO_URL))
+        gh_lbl.bind("<Button-1>", lambda e: self.open_url(GITHUB_REPO_URL))
 
         # Buttons: GitHub / Release / Donate / Check for Update
         btn_wrap = ttk.Frame(frame)
@@ -925,21 +1748,21 @@ class App(tk.Tk):
             btn_wrap,
             text="Open GitHub Page",
             style="Big.TButton",
-            command=lambda: webbrowser.open(GITHUB_REPO_URL)
+            command=lambda: self.open_url(GITHUB_REPO_URL)
         ).pack(fill="x", pady=3)
 
         ttk.Button(
             btn_wrap,
             text="Open Releases Page",
             style="Big.TButton",
-            command=lambda: webbrowser.open(GITHUB_RELEASES_PAGE)
+            command=lambda: self.open_url(GITHUB_RELEASES_PAGE)
         ).pack(fill="x", pady=3)
 
         ttk.Button(
             btn_wrap,
             text="Donate ❤️",
             style="Big.TButton",
-            command=lambda: webbrowser.open(DONATE_PAGE)
+            command=lambda: self.open_url(DONATE_PAGE)
         ).pack(fill="x", pady=3)
 
         ttk.Button(
@@ -956,10 +1779,13 @@ class App(tk.Tk):
         d = filedialog.askdirectory(initialdir=self.backup_dir.get())
         if d:
             self.backup_dir.set(d)
-            cache = load_cache()
-            cache["last_backup_dir"] = d
-            save_cache(cache)
+            self._cache["last_backup_dir"] = d
+            self.mark_cache_dirty()
+
 
+    def on_compression_changed(self, event=None):
+        self._cache["compression"] = self.compression.get()
+        self.mark_cache_dirty()
 
     def on_find_paths(self):
         game = self.game_entry.get().strip()
@@ -972,11 +1798,12 @@ class App(tk.Tk):
         log_append(self.log, f"Finding save paths for: {game}")
 
         def work():
-            found, hints = find_save_paths(game, self.log)
+            found, hints = find_save_paths(game, self.log, self._cache)
             return (found, hints)
 
         def ok(res):
             found, hints = res
+            self.mark_cache_dirty()
             self.found_paths = found
 
             if not found:
@@ -988,8 +1815,7 @@ class App(tk.Tk):
                 return
 
             self.paths_list.delete(0, "end")
-            for p in found:
-                self.paths_list.insert("end", p)
+            self.paths_list.insert("end", *found)
             self.backup_btn.config(state="normal")
 
         def err(e, tb):
@@ -1007,12 +1833,13 @@ class App(tk.Tk):
         backup_root = self.backup_dir.get() or DEFAULT_BACKUP_DIR
         os.makedirs(backup_root, exist_ok=True)
 
-        cache = load_cache()
-        cache["last_backup_dir"] = backup_root
-        save_cache(cache)
+        self._cache["last_backup_dir"] = backup_root
+        self.mark_cache_dirty()
+
+        level = COMPRESSION_LEVELS.get(self.compression.get(), COMPRESSION_LEVELS[DEFAULT_COMPRESSION])
 
         def work():
-            return make_backup(game, self.found_paths, backup_root, self.log)
+            return make_backup(game, self.found_paths, backup_root, self.log, level)
 
         def ok(zip_path):
             messagebox.showinfo("Backup Complete", f"Backup created:\n{zip_path}")
@@ -1059,9 +1886,10 @@ class App(tk.Tk):
             messagebox.showerror("Error", "Please select a valid backup ZIP.")
             return
 
-        # Phase 1: analyze metadata + conflicts in background
+        # Phase 1: analyze metadata + conflicts in background, building the
+        # (member, destination) plan that phase 2 extracts without re-parsing
         def analyze():
-            with zipfile.ZipFile(zipf, "r") as z:
+            with open_backup_zip(zipf) as z:
                 try:
                     meta = json.loads(z.read("__pcsm_paths.json").decode("utf-8"))
                 except Exception:
@@ -1073,33 +1901,26 @@ class App(tk.Tk):
 
                 index_map = {p["index"]: p for p in paths_meta}
 
-                conflict = False
-                file_count = 0
-
+                plan = []
                 for zinfo in z.infolist():
-                    if zinfo.filename == "__pcsm_paths.json" or zinfo.filename.endswith("/"):
-                        continue
-                    parts = zinfo.filename.split("/", 1)
-                    if len(parts) != 2:
-                        continue
-                    idx_s, rel = parts
-                    try:
-                        idx = int(idx_s)
-                    except Exception:
+                    m = _ENTRY_RX.match(zinfo.filename)
+                    if not m:
                         continue
-                    rec = index_map.get(idx)
+                    idx_s, rel = m.groups()
+                    rec = index_map.get(int(idx_s))
                     if not rec:
                         continue
                     base = rec["base"]
                     typ = rec["type"]
                     dest = os.path.join(base, rel) if typ == "dir" else base
-                    file_count += 1
-                    if os.path.exists(dest):
-                        conflict = True
-                return {"conflict": conflict, "file_count": file_count}
+                    plan.append((zinfo, dest))
+
+            conflict = any_existing([dest for _, dest in plan])
+            return {"conflict": conflict, "file_count": len(plan), "plan": plan}
 
         def after_analyze(info):
             conflict = info["conflict"]
+            plan = info["plan"]
 
             if conflict:
                 ok = messagebox.askokcancel(
@@ -1113,33 +1934,44 @@ class App(tk.Tk):
 
             # Phase 2: do actual restore in background
             def do_restore():
-                with zipfile.ZipFile(zipf, "r") as z:
-                    meta = json.loads(z.read("__pcsm_paths.json").decode("utf-8"))
-                    paths_meta = meta.get("paths", [])
-                    index_map = {p["index"]: p for p in paths_meta}
-
-                    count = 0
-                    for zinfo in z.infolist():
-                        if zinfo.filename == "__pcsm_paths.json" or zinfo.filename.endswith("/"):
-                            continue
-                        parts = zinfo.filename.split("/", 1)
-                        if len(parts) != 2:
-                            continue
-                        idx_s, rel = parts
-                        try:
-                            idx = int(idx_s)
-                        except Exception:
-                            continue
-                        rec = index_map.get(idx)
-                        if not rec:
-                            continue
-                        base = rec["base"]
-                        typ = rec["type"]
-                        dest = os.path.join(base, rel) if typ == "dir" else base
-                        os.makedirs(os.path.dirname(dest), exist_ok=True)
-                        with z.open(zinfo) as src, open(dest, "wb") as dst:
-                            shutil.copyfileobj(src, dst)
+                # Shortest first: parents exist by the time their children are
+                # made, so each makedirs() is a single mkdir, not a walk upward
+                for parent in sorted({os.path.dirname(dest) for _, dest in plan}, key=len):
+                    os.makedirs(parent, exist_ok=True)
+
+                # A ZipFile can't serve concurrent reads: one handle per worker
+                local = threading.local()
+                handles = contextlib.ExitStack()
+                handles_lock = threading.Lock()
+
+                def extract(zinfo, dest):
+                    z = getattr(local, "z", None)
+                    if z is None:
+                        with handles_lock:
+                            z = local.z = handles.enter_context(open_backup_zip(zipf))
+                    extract_member(z, zinfo, dest)
+
+                # Bounded in-flight window: closing the window mid-restore leaves
+                # at most a few queued extracts for the pool's exit join
+                pending = deque()
+                count = 0
+
+                def drain(limit):
+                    nonlocal count
+                    while len(pending) > limit:
+                        pending.popleft().result()
                         count += 1
+
+                with handles, ThreadPoolExecutor(max_workers=RESTORE_WORKERS) as pool:
+                    try:
+                        for zinfo, dest in plan:
+                            pending.append(pool.submit(extract, zinfo, dest))
+                            drain(RESTORE_WORKERS * 2)
+                        drain(0)
+                    except BaseException:
+                        for fut in pending:
+                            fut.cancel()
+                        raise
                     return count
 
             def after_restore(count):
@@ -1192,25 +2024,50 @@ class App(tk.Tk):
         self.suggest_after_id = self.after(300, lambda: self.run_suggestion_search(text_in, seq))
 
     def run_suggestion_search(self, text, seq):
-        def worker(q, seq):
-            results = []
+        key = text.strip().lower()
+        cached = self._suggest_cache.get(key)
+        if cached is not None:
+            # Seen this query before: no thread, no request
+            self._suggest_cache.move_to_end(key)
+            self.show_suggestions(cached, text, seq)
+            return
+
+        def done(results):
+            self._suggest_cache[key] = results
+            if len(self._suggest_cache) > SUGGEST_CACHE_SIZE:
+                self._suggest_cache.popitem(last=False)
+            self.show_suggestions(results, text, seq)
+
+        def fetch(q, seq):
+            # Superseded by a newer keystroke while the previous fetch ran
+            if seq != self.suggest_seq:
+                return
             try:
-                params = {
-                    "action": "query",
-                    "list": "search",
-                    "srsearch": q,
-                    "srlimit": 20,
-                    "format": "json",
-                }
-                url = PCGW_API + "?" + urllib.parse.urlencode(params)
-                with urllib.request.urlopen(url, timeout=10) as r:
-                    data = json.loads(r.read().decode("utf-8"))
-                results = [i["title"] for i in data.get("query", {}).get("search", [])]
+                results = pcgw_suggest_titles(q)
             except:
-                pass
-            self.after(0, lambda: self.show_suggestions(results, q, seq))
+                # Not cached, so the next keystroke retries
+                self.after(0, lambda: self.show_suggestions([], text, seq))
+                return
+            self.after(0, lambda: done(results))
 
-        threading.Thread(target=worker, args=(text, seq,), daemon=True).start()
+        with self._suggest_lock:
+            self._suggest_next = (fetch, key, seq)
+            if self._suggest_running:
+                return
+            self._suggest_running = True
+        threading.Thread(target=self._suggest_worker, daemon=True).start()
+
+    def _suggest_worker(self):
+        """Run queued autocomplete fetches one at a time until none is waiting."""
+        while True:
+            with self._suggest_lock:
+                job = self._suggest_next
+                self._suggest_next = None
+                if job is None:
+                    self._suggest_running = False
+                    return
+            fetch, q, seq = job
+            fetch(q, seq)
 
     def show_suggestions(self, results, query, seq):
         # Ignore stale results or when user left the Backup tab
@@ -1234,8 +2091,7 @@ class App(tk.Tk):
             return
 
         lb = tk.Listbox(self, height=min(10, len(results)))
-        for r in results:
-            lb.insert("end", r)
+        lb.insert("end", *results)
 
         x = self.game_entry.winfo_rootx() - self.winfo_rootx()
         y = (self.game_entry.winfo_rooty() - self.winfo_rooty()
@@ -1337,24 +2193,36 @@ class App(tk.Tk):
     # -----------------------------
     # Update check helpers
     # -----------------------------
-    def _parse_ver_tuple(self, v: str):
-        nums = re.findall(r"\d+", v)
-        return tuple(int(n) for n in nums[:4]) or (0,)
-
+    def fetch_latest_release_tag(self):
+        """Latest release tag from GitHub (safe to call from a worker thread).
+
+        Revalidates with the cached ETag, so an unchanged release is a 304
+        with no body instead of the full ~20 KB release JSON.
+        """
+        etag = self._cache.get("gh_etag")
+        cached_tag = self._cache.get("gh_tag")
+        headers = {"If-None-Match": etag} if etag and cached_tag else None
+
+        status, resp_headers, body = http_get(GITHUB_API_LATEST, headers=headers, timeout=10)
+        if status == 304:
+            return cached_tag
+
+        data = json.loads(body)
+        tag = str(data.get("tag_name") or data.get("name") or "").strip()
+        new_etag = resp_headers.get("ETag")
+        if new_etag:
+            self._cache["gh_etag"] = new_etag
+            self._cache["gh_tag"] = tag
+            self.after(0, self.mark_cache_dirty)
+        return tag
 
     def manual_check_for_update(self):
         """Manual check from About tab."""
 
         def work():
-            req = urllib.request.Request(
-                GITHUB_API_LATEST,
-                headers={"User-Agent": "PC-Savegame-Manager"}
-            )
-            with urllib.request.urlopen(req, timeout=10) as r:
-                data = json.loads(r.read().decode("utf-8", "replace"))
-            tag = str(data.get("tag_name") or data.get("name") or "").strip()
+            tag = self.fetch_latest_release_tag()
             cur = APP_VERSION
-            newer = bool(tag and self._parse_ver_tuple(tag) > self._parse_ver_tuple(cur))
+            newer = bool(tag and parse_ver_tuple(tag) > parse_ver_tuple(cur))
             return (tag, cur, newer)
 
         def ok(res):
@@ -1364,7 +2232,7 @@ class App(tk.Tk):
                     "New Version Available",
                     f"A newer version {tag} is available.\n\nOpen the releases page now?"
                 ):
-                    webbrowser.open(GITHUB_RELEASES_PAGE)
+                    self.open_url(GITHUB_RELEASES_PAGE)
             else:
                 messagebox.showinfo("You're up to date", f"Current version {cur} is the latest.")
 
@@ -1377,20 +2245,14 @@ class App(tk.Tk):
         """Automatic check on startup; silent on errors."""
         def worker():
             try:
-                req = urllib.request.Request(
-                    GITHUB_API_LATEST,
-                    headers={"User-Agent": "PC-Savegame-Manager"}
-                )
-                with urllib.request.urlopen(req, timeout=10) as r:
-                    data = json.loads(r.read().decode("utf-8", "replace"))
-                tag = str(data.get("tag_name") or data.get("name") or "").strip()
-                if tag and self._parse_ver_tuple(tag) > self._parse_ver_tuple(APP_VERSION):
+                tag = self.fetch_latest_release_tag()
+                if tag and parse_ver_tuple(tag) > parse_ver_tuple(APP_VERSION):
                     def _ask():
                         if messagebox.askyesno(
                             "New Version Available",
                             f"A newer version {tag} is available.\n\nOpen the releases page now?"
                         ):
-                            webbrowser.open(GITHUB_RELEASES_PAGE)
+                            self.open_url(GITHUB_RELEASES_PAGE)
                     self.after(0, _ask)
             except Exception:
                 # Ignore any error on auto-check